@@ -1,11 +1,5 @@
-from .retry_session import RetrySession
-from .utils import (
-    fingerprint_path,
-    is_docker_supported,
-    run_command,
-    validate_compose_yaml,
-    wrap_ghsession,
-)
+from importlib import import_module
+from typing import Any
 
 __all__ = [
     "RetrySession",
@@ -15,3 +9,23 @@ __all__ = [
     "validate_compose_yaml",
     "wrap_ghsession",
 ]
+
+# home modules for each re-export, resolved lazily (PEP 562) so that importing the
+# package doesn't drag in requests et al before a command actually needs them
+_EXPORTS = {
+    "RetrySession": ".retry_session",
+    "fingerprint_path": ".utils",
+    "is_docker_supported": ".utils",
+    "run_command": ".utils",
+    "validate_compose_yaml": ".utils",
+    "wrap_ghsession": ".utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = import_module(_EXPORTS[name], __name__)
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(module, name)
@@ -1,7 +1,6 @@
-import shutil
+from functools import lru_cache
 from pathlib import Path
-from string import Template
-from typing import Optional
+from typing import List, Optional, Union
 
 import typer
 
@@ -10,6 +9,15 @@ import sdcli.utils as utils
 s3 = typer.Typer(callback=utils.is_docker_supported)
 
 
+@lru_cache(maxsize=None)
+def _bridge_template() -> str:
+    """
+    Reads the bridge service template. The template is package data that never
+    changes at runtime, so it is only read from disk once per process.
+    """
+    return Path(__file__).with_name("docker-compose.yaml").read_text()
+
+
 @s3.command("bridge", no_args_is_help=True)
 def start_bridge(
     fingerprint: Optional[str] = typer.Option(
@@ -64,27 +72,26 @@ def start_bridge(
 
         print("New bucket information provided. Configuring a new bridge...")
         yaml.parent.mkdir(parents=True, exist_ok=True)
-        templ_yaml = Path(__file__).with_name("docker-compose.yaml")
-
-        with templ_yaml.open("r") as f:
-            template = Template(f.read())
-            yaml.write_text(
-                template.substitute(
-                    {
-                        "AWS_S3_BUCKET": bucket,
-                        "AWS_S3_ACCESS_KEY_ID": access_key_id,
-                        "AWS_S3_SECRET_ACCESS_KEY": secret_access_key,
-                        "FINGERPRINT": det_fingerprint,
-                    }
-                )
+        yaml.write_text(
+            _bridge_template().format_map(
+                {
+                    "AWS_S3_BUCKET": bucket,
+                    "AWS_S3_ACCESS_KEY_ID": access_key_id,
+                    "AWS_S3_SECRET_ACCESS_KEY": secret_access_key,
+                    "FINGERPRINT": det_fingerprint,
+                }
             )
+        )
 
         # validate and normalize the generated yaml. this helps catch version mismatches
         # between the template and the locally installed compose version
         utils.validate_compose_yaml(yaml, fp_path)
     else:
         print("Existing S3 bridge configuration found.")
-        if not force_restart and utils.is_container_running(det_fingerprint):
+        # the full container name pins the running check to this bridge alone
+        if not force_restart and utils.is_container_running(
+            f"blackstrap_bridge_{det_fingerprint}"
+        ):
             typer.secho(
                 "\n[ ! ] Your S3 bridge is already running!\n      If you intended to"
                 " force a restart, you must specify the --force-restart option.",
@@ -95,9 +102,12 @@ def start_bridge(
             operation = f"re{operation}"
 
     print(f"Your S3 bridge is {operation}ing. This may take a few seconds.")
-    utils.run_command(
-        ["docker-compose", "-f", str(yaml), "up", "-d", "--force-recreate"]
-    )
+    up_command: List[Union[str, Path]] = ["docker-compose", "-f", yaml, "up", "-d"]
+    if operation == "restart":
+        # recreation only matters when containers already exist; a brand-new bridge
+        # skips the teardown work the flag would otherwise trigger
+        up_command.append("--force-recreate")
+    utils.run_command(up_command)
 
     typer.secho(
         f"\n[ ✔ ] Successfully {operation}ed your S3 bridge!\n      The service has the"
@@ -119,7 +129,7 @@ def stop_bridge(
     _, fp_path = utils.fingerprint_path("blackstrap", "s3", fingerprint=fingerprint)
     yaml = fp_path / "docker-compose.yaml"
 
-    if not utils.is_container_running(fingerprint):
+    if not utils.is_container_running(f"blackstrap_bridge_{fingerprint}"):
         typer.secho("\n[ ! ] Your S3 bridge is not running.", fg=typer.colors.YELLOW)
         raise typer.Exit(code=1)
     elif not yaml.exists():
@@ -133,7 +143,7 @@ def stop_bridge(
         raise typer.Exit(code=1)
 
     print("Shutting down your S3 bridge...")
-    utils.run_command(["docker-compose", "-f", str(yaml), "stop"])
+    utils.run_command(["docker-compose", "-f", yaml, "stop"])
 
     typer.secho(
         "[ ✔ ] Successfully stopped your S3 bridge.\n      You can restart it"
@@ -150,13 +160,15 @@ def remove_bridge(
     )
 ) -> None:
     """Shuts down and removes an existing S3 bridge."""
+    import shutil
+
     _, fp_path = utils.fingerprint_path("blackstrap", "s3", fingerprint=fingerprint)
     yaml = fp_path / "docker-compose.yaml"
 
     print("Removing your S3 bridge...")
 
     if yaml.exists():
-        utils.run_command(["docker-compose", "-f", str(yaml), "down", "--volumes"])
+        utils.run_command(["docker-compose", "-f", yaml, "down", "--volumes"])
         print()
 
     shutil.rmtree(fp_path)
@@ -1,29 +1,93 @@
 # mypy: disable-error-code="override"
 
+import random
 import time
-from typing import Any, Union
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional, Union
 
+from cachecontrol import CacheControlAdapter
+from cachecontrol.caches.file_cache import FileCache
 from requests import Response, Session
 
+from .utils import _sdcli_home
+
+# transient statuses worth retrying even when the server offers no guidance
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# total attempts per request; bulk jobs should fail loudly rather than hang
+# forever under sustained throttling
+_MAX_ATTEMPTS = 5
+
+
+def _retry_after(resp: Response) -> Optional[float]:
+    """
+    Returns the server-requested retry delay in seconds, if any. The header may
+    carry either a seconds count or an HTTP-date (RFC 9110).
+    """
+    retry = resp.headers.get("Retry-After")
+    if not retry:
+        return None
+
+    try:
+        seconds = float(retry)
+    except ValueError:
+        delta = parsedate_to_datetime(retry) - datetime.now(timezone.utc)
+        seconds = delta.total_seconds()
+
+    return max(seconds, 0) or None
+
 
 class RetrySession(Session):
     """
-    Identical to a requests Session in every way, except that it automatically retries
-    requests that respond with a "Retry-After" header and raises an error if the
-    response is not valid (HTTP 400-600).
+    Identical to a requests Session in every way, except that it automatically
+    retries requests that respond with a "Retry-After" header or a transient
+    failure status — backing off exponentially with jitter when the server gives
+    no delay — and raises an error if the final response is not valid
+    (HTTP 400-600). Retries are bounded so sustained throttling surfaces as an
+    error instead of an endless wait. Sessions come pre-mounted with a pooled,
+    header-respecting caching adapter so every consumer reuses sockets and
+    conditional responses without wiring it up themselves.
     """
 
+    def __init__(self) -> None:
+        super().__init__()
+
+        # everything goes to the one API host, so a single keep-alive pool sized
+        # to the bulk-command thread fan-out lets workers reuse TLS sockets
+        # instead of re-handshaking per request. cached responses persist on
+        # disk so repeat CLI runs can revalidate with conditional requests
+        # (GitHub sends strong ETags) instead of re-transferring bodies.
+        adapter = CacheControlAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            cache=FileCache(str(_sdcli_home() / ".httpcache")),
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
     def request(
         self, method: Union[str, bytes], url: Union[str, bytes], **kwargs: Any
     ) -> Response:
-        resp: Response = super().request(method, url, **kwargs)
-
-        # GitHub et al may rate limit us, in which case we need to wait
-        # the amount of time they tell us before retrying
-        retry: float = float(resp.headers.get("Retry-After", 0))
-        if retry:
-            time.sleep(retry)
-            return self.request(method, url, **kwargs)
+        # an iterative loop rather than recursion: each retry reuses this frame
+        # instead of stacking a fresh one (and re-entering request prep) per wait
+        for attempt in range(_MAX_ATTEMPTS):
+            resp: Response = super().request(method, url, **kwargs)
+
+            if attempt == _MAX_ATTEMPTS - 1:
+                break
+
+            # GitHub et al may rate limit us, in which case we need to wait
+            # the amount of time they tell us before retrying
+            delay = _retry_after(resp)
+            if delay is None:
+                if resp.status_code not in _RETRYABLE_STATUSES:
+                    break
+                # no server guidance; back off exponentially with jitter so a
+                # burst of throttled workers doesn't retry in lockstep
+                delay = 2**attempt * (0.5 + random.random() / 2)
+
+            time.sleep(delay)
 
         resp.raise_for_status()
         return resp
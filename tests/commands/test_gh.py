@@ -23,8 +23,10 @@ def test_invite_single(requests_mock, invoke_command):
     """Test invocation for inviting a single email to the org."""
     # mocked github requests
     requests_mock.get(
-        "https://api.github.com/orgs/metabronx/teams",
-        json=[{"id": 1, "slug": "abba"}, {"id": 2, "slug": "queen"}],
+        "https://api.github.com/orgs/metabronx/teams/abba", json={"id": 1}
+    )
+    requests_mock.get(
+        "https://api.github.com/orgs/metabronx/teams/queen", json={"id": 2}
     )
     requests_mock.post("https://api.github.com/orgs/metabronx/invitations")
 
@@ -34,8 +36,8 @@ def test_invite_single(requests_mock, invoke_command):
     )
     assert res.exit_code == 0
 
-    # one for the team call, one for the invite
-    assert requests_mock.call_count == 2
+    # one per team call, one for the invite
+    assert requests_mock.call_count == 3
 
     req = requests_mock.last_request
     assert req.method == "POST"
@@ -50,8 +52,10 @@ def test_invite_single(requests_mock, invoke_command):
 def test_invite_from_file(requests_mock, invoke_command):
     """Test the invocation for inviting multiple emails via CSV."""
     requests_mock.get(
-        "https://api.github.com/orgs/metabronx/teams",
-        json=[{"id": 1, "slug": "abba"}, {"id": 2, "slug": "queen"}],
+        "https://api.github.com/orgs/metabronx/teams/abba", json={"id": 1}
+    )
+    requests_mock.get(
+        "https://api.github.com/orgs/metabronx/teams/queen", json={"id": 2}
     )
     requests_mock.post("https://api.github.com/orgs/metabronx/invitations")
 
@@ -66,17 +70,86 @@ def test_invite_from_file(requests_mock, invoke_command):
     )
     assert res.exit_code == 0
 
-    # one for the team call, 1 for each invite
-    assert requests_mock.call_count == 3
+    # one per team call, 1 for each invite
+    assert requests_mock.call_count == 4
 
-    for i, req in enumerate(requests_mock.request_history[1:]):
+    # invitations fan out over a thread pool, so their order isn't guaranteed
+    emails = set()
+    for req in requests_mock.request_history[2:]:
         assert req.method == "POST"
         assert req.url == "https://api.github.com/orgs/metabronx/invitations"
-        assert req.json() == {
-            "email": f"test.user{i}@metabronx.com",
-            "role": "direct_member",
-            "team_ids": [1, 2],
-        }
+        body = req.json()
+        assert body["role"] == "direct_member"
+        assert body["team_ids"] == [1, 2]
+        emails.add(body["email"])
+
+    assert emails == {"test.user0@metabronx.com", "test.user1@metabronx.com"}
+
+
+def test_invite_deduplicates_file(requests_mock, invoke_command):
+    """Check that duplicate and blank lines in the file don't cost extra calls."""
+    requests_mock.get(
+        "https://api.github.com/orgs/metabronx/teams/abba", json={"id": 1}
+    )
+    requests_mock.post("https://api.github.com/orgs/metabronx/invitations")
+
+    Path("mock_accounts.csv").write_text(
+        "test.user@metabronx.com\n\ntest.user@metabronx.com\n"
+    )
+
+    res = invoke_command(
+        "gh invite --from-file mock_accounts.csv --team abba",
+        env={"GH_USERNAME": "test.user", "GH_TOKEN": "password"},
+    )
+    assert res.exit_code == 0
+
+    # one for the team call, one for the single unique invite
+    assert requests_mock.call_count == 2
+    assert b"invited 1 person(s)" in res.stdout_bytes
+
+
+def test_invite_skips_invalid_emails(requests_mock, invoke_command):
+    """Check that lines which aren't email addresses never reach the API."""
+    requests_mock.get(
+        "https://api.github.com/orgs/metabronx/teams/abba", json={"id": 1}
+    )
+    requests_mock.post("https://api.github.com/orgs/metabronx/invitations")
+
+    Path("mock_accounts.csv").write_text(
+        "test.user@metabronx.com\nnot-an-email\n# comment"
+    )
+
+    res = invoke_command(
+        "gh invite --from-file mock_accounts.csv --team abba",
+        env={"GH_USERNAME": "test.user", "GH_TOKEN": "password"},
+    )
+    assert res.exit_code == 0
+
+    # one for the team call, one for the single valid invite
+    assert requests_mock.call_count == 2
+    assert b"Skipped 2 line(s)" in res.stdout_bytes
+    assert b"invited 1 person(s)" in res.stdout_bytes
+
+
+def test_invite_cached_teams(requests_mock, invoke_command):
+    """Check that the org team mapping is cached to disk and reused on warm runs."""
+    requests_mock.get(
+        "https://api.github.com/orgs/metabronx/teams/abba", json={"id": 1}
+    )
+    requests_mock.get(
+        "https://api.github.com/orgs/metabronx/teams/queen", json={"id": 2}
+    )
+    requests_mock.post("https://api.github.com/orgs/metabronx/invitations")
+
+    env = {"GH_USERNAME": "test.user", "GH_TOKEN": "password"}
+    res = invoke_command("gh invite test.user0@metabronx.com --team abba", env=env)
+    assert res.exit_code == 0
+    res = invoke_command("gh invite test.user1@metabronx.com --team abba", env=env)
+    assert res.exit_code == 0
+
+    # one for the team call, then one per invite; the second invocation resolves
+    # the team from the on-disk cache
+    assert requests_mock.call_count == 3
 
 
 def test_invite_single_and_file_bad(requests_mock, invoke_command):
@@ -113,16 +186,20 @@ def test_assign_teams(requests_mock, invoke_command):
     )
     assert res.exit_code == 0
 
-    # one for each assignment
+    # one for each assignment. distinct teams are submitted in parallel, so the
+    # order of requests isn't guaranteed
     assert requests_mock.call_count == len(assignments)
 
-    for (u, t), req in zip(assignments, requests_mock.request_history):
+    urls = set()
+    for req in requests_mock.request_history:
         assert req.method == "PUT"
-        assert (
-            req.url
-            == f"https://api.github.com/orgs/metabronx/teams/{t}/memberships/{u}"
-        )
         assert req.json() == {"role": "member"}
+        urls.add(req.url)
+
+    assert urls == {
+        f"https://api.github.com/orgs/metabronx/teams/{t}/memberships/{u}"
+        for u, t in assignments
+    }
 
 
 def test_remove_single(requests_mock, invoke_command):
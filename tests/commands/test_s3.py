@@ -11,23 +11,22 @@ def test_bridge_new(mock_run_command, truthy_check_docker, invoke_command, files
     assert b"New bucket information provided." in res.stdout_bytes
     assert b"Connect to your bucket via SFTP" in res.stdout_bytes
 
-    yaml = str(
+    yaml = (
         filesystem
         / ".sdcli"
         / "blackstrap"
         / "s3"
-        / "50da709fdb20cf097cfa452ac2ae13cb"
+        / "3dc19019746400999c71374e12dd96e5"
         / "docker-compose.yaml"
     )
+    str_yaml = str(yaml)
 
     mock_run_command.assert_any_call(
-        ["docker-compose", "-f", yaml, "config", "-o", yaml],
+        ["docker-compose", "-f", str_yaml, "config", "-o", str_yaml],
         capture=True,
         exit_on_error=False,
     )
-    mock_run_command.assert_any_call(
-        ["docker-compose", "-f", yaml, "up", "-d", "--force-recreate"]
-    )
+    mock_run_command.assert_any_call(["docker-compose", "-f", yaml, "up", "-d"])
 
 
 def test_bridge_new_invalid(
@@ -64,16 +63,19 @@ def test_bridge_existing_stopped(
     assert res.exit_code == 0
     assert b"Existing S3 bridge configuration found." in res.stdout_bytes
     assert b"Connect to your bucket via SFTP" in res.stdout_bytes
-    mock_run_command.assert_any_call('docker ps --format "{{.Names}}"', capture=True)
     mock_run_command.assert_any_call(
         [
-            "docker-compose",
-            "-f",
-            str(yaml),
-            "up",
-            "-d",
-            "--force-recreate",
-        ]
+            "docker",
+            "ps",
+            "--format",
+            "{{.Names}}",
+            "--filter",
+            "name=blackstrap_bridge_banana",
+        ],
+        capture=True,
+    )
+    mock_run_command.assert_any_call(
+        ["docker-compose", "-f", yaml, "up", "-d", "--force-recreate"]
     )
 
 
@@ -118,17 +120,18 @@ def test_bridge_existing_restart(
     assert b"Existing S3 bridge configuration found." in res.stdout_bytes
     assert b"Connect to your bucket via SFTP" in res.stdout_bytes
     mock_run_command.assert_not_any_call(
-        'docker ps --format "{{.Names}}"', capture=True
+        [
+            "docker",
+            "ps",
+            "--format",
+            "{{.Names}}",
+            "--filter",
+            "name=blackstrap_bridge_banana",
+        ],
+        capture=True,
     )
     mock_run_command.assert_any_call(
-        [
-            "docker-compose",
-            "-f",
-            str(yaml),
-            "up",
-            "-d",
-            "--force-recreate",
-        ]
+        ["docker-compose", "-f", yaml, "up", "-d", "--force-recreate"]
     )
 
 
@@ -147,8 +150,18 @@ def test_stop_bridge(mock_run_command, truthy_check_docker, invoke_command, file
 
     assert res.exit_code == 0
     assert b"Shutting down your S3 bridge..." in res.stdout_bytes
-    mock_run_command.assert_any_call('docker ps --format "{{.Names}}"', capture=True)
-    mock_run_command.assert_any_call(["docker-compose", "-f", str(yaml), "stop"])
+    mock_run_command.assert_any_call(
+        [
+            "docker",
+            "ps",
+            "--format",
+            "{{.Names}}",
+            "--filter",
+            "name=blackstrap_bridge_banana",
+        ],
+        capture=True,
+    )
+    mock_run_command.assert_any_call(["docker-compose", "-f", yaml, "stop"])
 
 
 def test_stop_bridge_not_running(
@@ -168,7 +181,17 @@ def test_stop_bridge_not_running(
 
     assert res.exit_code == 1
     assert b"Your S3 bridge is not running." in res.stdout_bytes
-    mock_run_command.assert_any_call('docker ps --format "{{.Names}}"', capture=True)
+    mock_run_command.assert_any_call(
+        [
+            "docker",
+            "ps",
+            "--format",
+            "{{.Names}}",
+            "--filter",
+            "name=blackstrap_bridge_banana",
+        ],
+        capture=True,
+    )
 
 
 def test_stop_bridge_invalid(
@@ -191,7 +214,17 @@ def test_stop_bridge_invalid(
         b"Your S3 bridge is running, but its underlying configuration file is missing."
         in res.stdout_bytes
     )
-    mock_run_command.assert_any_call('docker ps --format "{{.Names}}"', capture=True)
+    mock_run_command.assert_any_call(
+        [
+            "docker",
+            "ps",
+            "--format",
+            "{{.Names}}",
+            "--filter",
+            "name=blackstrap_bridge_banana",
+        ],
+        capture=True,
+    )
 
 
 def test_delete_bridge(
@@ -212,7 +245,7 @@ def test_delete_bridge(
     assert res.exit_code == 0
     assert b"Successfully removed your S3 bridge." in res.stdout_bytes
     mock_run_command.assert_any_call(
-        ["docker-compose", "-f", str(yaml), "down", "--volumes"]
+        ["docker-compose", "-f", yaml, "down", "--volumes"]
     )
 
     assert not yaml.exists()
@@ -238,13 +271,7 @@ def test_delete_bridge_invalid(
     assert res.exit_code == 0
     assert b"Successfully removed your S3 bridge." in res.stdout_bytes
     mock_run_command.assert_not_any_call(
-        [
-            "docker-compose",
-            "-f",
-            str(fp_path / "docker-compose.yaml"),
-            "down",
-            "--volumes",
-        ]
+        ["docker-compose", "-f", fp_path / "docker-compose.yaml", "down", "--volumes"]
     )
 
     assert not fp_path.exists()
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from typer.testing import CliRunner
 
+import sdcli.utils as utils
 from sdcli.main import app
 
 
@@ -24,6 +25,12 @@ def runner():
 
 @pytest.fixture(autouse=True)
 def filesystem(runner, monkeypatch):
+    # credentials and the GitHub session are memoized per-process, so drop
+    # anything a previous test resolved before handing out a fresh filesystem
+    utils._get_creds.cache_clear()
+    utils._gh_session.cache_clear()
+    utils._sdcli_home.cache_clear()
+
     with runner.isolated_filesystem() as fs:
         home = Path(fs)
 
@@ -1,5 +1,8 @@
 from unittest.mock import patch
 
+import pytest
+from requests import HTTPError
+
 from sdcli.retry_session import RetrySession
 
 
@@ -28,3 +31,41 @@ def test_retry_session_retry(requests_mock):
 
             mock.assert_called_once_with(42)
             assert resp.text == "some html"
+
+
+def test_retry_session_backoff(requests_mock):
+    """
+    Checks if a RetrySession retries transient failures with a backoff delay even
+    when the response carries no retry header.
+    """
+    requests_mock.get(
+        "https://example.com",
+        [{"status_code": 503}, {"text": "some html"}],
+    )
+
+    with patch("time.sleep") as mock:
+        with RetrySession() as session:
+            resp = session.get("https://example.com")
+
+            # first-attempt backoff is 1s scaled by jitter in [0.5, 1)
+            mock.assert_called_once()
+            assert 0.5 <= mock.call_args[0][0] < 1
+            assert resp.text == "some html"
+
+
+def test_retry_session_bounded(requests_mock):
+    """
+    Checks if a RetrySession gives up after a bounded number of attempts instead of
+    retrying forever under sustained throttling.
+    """
+    requests_mock.get(
+        "https://example.com",
+        status_code=429,
+        headers={"Retry-After": "42"},
+    )
+
+    with patch("time.sleep"), RetrySession() as session:
+        with pytest.raises(HTTPError):
+            session.get("https://example.com")
+
+    assert requests_mock.call_count == 5
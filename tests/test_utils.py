@@ -2,14 +2,12 @@
 import platform
 from contextlib import nullcontext, suppress
 from pathlib import Path
-from subprocess import CalledProcessError
-from unittest.mock import MagicMock
+from subprocess import CalledProcessError, CompletedProcess
 
 import pytest
 from typer import Exit as ExitError
 
 from sdcli.utils import (
-    _get_hashlib_kwargs,
     fingerprint_path,
     is_container_running,
     is_docker_supported,
@@ -22,60 +20,44 @@ PYTHON_VERSION = f"Python {platform.python_version()}"
 
 
 @pytest.mark.parametrize("version", [(3, 7), (3, 9)])
-def test_hashlib_kwargs(monkeypatch, version):
+def test_fingerprint_version_gate(monkeypatch, version, filesystem):
     """
-    Checks that the `usedforsecurity` kwarg to hashlib is only present on compatible
-    Python versions (3.9+).
+    Checks that fingerprints are identical on either side of the `usedforsecurity`
+    version gate (the kwarg only exists on 3.9+).
     """
     monkeypatch.setattr("sys.version_info", version)
 
-    kwargs = _get_hashlib_kwargs()
-    _get_hashlib_kwargs.cache_clear()
+    fp, _ = fingerprint_path("test", hashable=("param1", "param2"))
 
-    if version[1] == 7:
-        assert "usedforsecurity" not in kwargs
-    else:
-        assert kwargs["usedforsecurity"] is False
-
-
-def test_wrap_ghsession_no_auth(capfd):
-    """Checks that GitHub request sessions error properly if unauthenticated."""
-    with pytest.raises(ExitError):
-        with wrap_ghsession():
-            pass
-
-    assert "You must login" in capfd.readouterr().out
-
-
-def test_wrap_ghsession_bad_auth_env_vars(monkeypatch, requests_mock, capfd):
-    """
-    Checks that GitHub request sessions error properly if using bad environment
-    credentials.
-    """
-    monkeypatch.setenv("GH_USERNAME", "username")
-    monkeypatch.setenv("GH_TOKEN", "token")
-
-    with pytest.raises(ExitError):
-        with wrap_ghsession() as session:
-            session.get("https://example.com")
-
-    assert "Something went wrong communicating with GitHub." in capfd.readouterr().out
+    assert fp == "e4dc20a72cdca4bf067c4a7ae02c1dbe"
 
 
-def test_wrap_ghsession_bad_auth_file(monkeypatch, requests_mock, filesystem, capfd):
+@pytest.mark.parametrize("creds_source", ["none", "env", "file"])
+def test_wrap_ghsession_bad_auth(
+    creds_source, monkeypatch, requests_mock, filesystem, capsys
+):
     """
-    Checks that GitHub request sessions error properly if using bad cached file
-    credentials.
+    Checks that GitHub request sessions error properly when unauthenticated, and
+    when bad credentials come from the environment or the cached file.
     """
-    creds = filesystem / ".sdcli" / "credentials"
-    creds.parent.mkdir()
-    creds.write_text("username\ntoken")
+    if creds_source == "env":
+        monkeypatch.setenv("GH_USERNAME", "username")
+        monkeypatch.setenv("GH_TOKEN", "token")
+    elif creds_source == "file":
+        creds = filesystem / ".sdcli" / "credentials"
+        creds.parent.mkdir()
+        creds.write_text("username\ntoken")
 
     with pytest.raises(ExitError):
         with wrap_ghsession() as session:
             session.get("https://example.com")
 
-    assert "Something went wrong communicating with GitHub." in capfd.readouterr().out
+    expected = (
+        "You must login"
+        if creds_source == "none"
+        else "Something went wrong communicating with GitHub."
+    )
+    assert expected in capsys.readouterr().out
 
 
 @pytest.mark.parametrize(
@@ -117,13 +99,11 @@ def test_is_docker_supported(mock_run_command):
     """
     Checks that the docker support callback calls the proper commands.
     """
+    is_docker_supported.cache_clear()
     is_docker_supported()
 
-    mock_run_command.assert_any_call(
-        "docker version", capture=True, exit_on_error=False
-    )
-    mock_run_command.assert_any_call(
-        "docker-compose --version", capture=True, exit_on_error=False
+    mock_run_command.assert_called_once_with(
+        "docker-compose --version", discard=True, exit_on_error=False
     )
 
 
@@ -132,10 +112,9 @@ def test_is_docker_supported(mock_run_command):
     [
         CalledProcessError(returncode=1, cmd=["mock"]),
         FileNotFoundError(),
-        # this is for when docker exists but version failed due to the engine not
-        # running. we check if `.returncode == 0`, which it won't here since the mock
-        # attribute will also be a mock.
-        MagicMock(),
+        # this is for when docker-compose exists but failed due to the engine not
+        # running, in which case the probe returns normally with a bad code
+        CompletedProcess(args=["mock"], returncode=1),
     ],
 )
 def test_is_docker_supported_no(mock_run_command, error):
@@ -143,20 +122,19 @@ def test_is_docker_supported_no(mock_run_command, error):
     Checks the docker support callback errors gracefully if docker isn't installed or
     the engine isn't running.
     """
-    mock_run_command.side_effect = error
+    is_docker_supported.cache_clear()
+    if isinstance(error, Exception):
+        mock_run_command.side_effect = error
+    else:
+        mock_run_command.return_value = error
 
     with pytest.raises(ExitError):
         is_docker_supported()
 
-    mock_run_command.assert_any_call(
-        "docker version", capture=True, exit_on_error=False
+    mock_run_command.assert_called_once_with(
+        "docker-compose --version", discard=True, exit_on_error=False
     )
 
-    if isinstance(error, MagicMock):
-        mock_run_command.assert_any_call(
-            "docker-compose --version", capture=True, exit_on_error=False
-        )
-
 
 @pytest.mark.parametrize(
     "fingerprint,hashable,exce_msg",
@@ -164,9 +142,9 @@ def test_is_docker_supported_no(mock_run_command, error):
         # hashable
         (None, ("param1", "param2"), None),
         # fingerprint
-        ("7e1175602988b19bdca7a75619d5563f", (None, None), None),
+        ("e4dc20a72cdca4bf067c4a7ae02c1dbe", (None, None), None),
         # both, invalid
-        ("7e1175602988b19bdca7a75619d5563f", ("param1", "param2"), "You must supply"),
+        ("e4dc20a72cdca4bf067c4a7ae02c1dbe", ("param1", "param2"), "You must supply"),
         # neither, invalid
         (None, (None, None), "You must supply"),
         # incomplete hashable
@@ -175,12 +153,12 @@ def test_is_docker_supported_no(mock_run_command, error):
         ("bad-fingerprint", (None, None), "The provided fingerprint"),
     ],
 )
-def test_fingerprint_path(fingerprint, hashable, exce_msg, capfd):
+def test_fingerprint_path(fingerprint, hashable, exce_msg, capsys):
     """
     Check if `fingerprint_path` properly checks edge cases, and returns a proper
     fingerprint when provided with one or a complete hashable.
     """
-    det_fingerprint = "7e1175602988b19bdca7a75619d5563f"
+    det_fingerprint = "e4dc20a72cdca4bf067c4a7ae02c1dbe"
 
     Path(det_fingerprint).mkdir()
 
@@ -189,7 +167,23 @@ def test_fingerprint_path(fingerprint, hashable, exce_msg, capfd):
         assert fp == det_fingerprint
 
     if exce_msg:
-        assert exce_msg in capfd.readouterr().out
+        assert exce_msg in capsys.readouterr().out
+
+
+def test_fingerprint_path_migrates_md5(filesystem):
+    """
+    Check that a service directory cached under the legacy md5 fingerprint is
+    renamed to its blake2b equivalent when looked up by hashable.
+    """
+    # md5("param1|param2")
+    legacy = filesystem / ".sdcli" / "test" / "7e1175602988b19bdca7a75619d5563f"
+    legacy.mkdir(parents=True)
+
+    fp, path = fingerprint_path("test", hashable=("param1", "param2"))
+
+    assert fp == "e4dc20a72cdca4bf067c4a7ae02c1dbe"
+    assert path.exists()
+    assert not legacy.exists()
 
 
 def test_validate_compose_yaml(mock_run_command, filesystem):
@@ -206,7 +200,7 @@ def test_validate_compose_yaml(mock_run_command, filesystem):
     )
 
 
-def test_validate_compose_yaml_fail(mock_run_command, filesystem, capfd):
+def test_validate_compose_yaml_fail(mock_run_command, filesystem, capsys):
     """
     Checks that failed compose validation prints the proper error, renames the failed
     file, and logs the command and output.
@@ -229,7 +223,7 @@ def test_validate_compose_yaml_fail(mock_run_command, filesystem, capfd):
         exit_on_error=False,
     )
 
-    assert "could not be validated" in capfd.readouterr().out
+    assert "could not be validated" in capsys.readouterr().out
     assert yaml.with_name("docker-compose.yaml.invalid").exists()
     assert (
         yaml.with_name("validation.log").read_text() == "==> validate-yaml\n\nmock err"
@@ -242,5 +236,6 @@ def test_is_container_running(mock_run_command):
 
     assert not is_container_running("banana")
     mock_run_command.assert_called_once_with(
-        'docker ps --format "{{.Names}}"', capture=True
+        ["docker", "ps", "--format", "{{.Names}}", "--filter", "name=banana"],
+        capture=True,
     )